@@ -1,8 +1,7 @@
-import json
-import jsonpickle
+import cachetools
+import diskcache
 
 from abc import ABC, abstractmethod
-from pathlib import Path
 
 
 class Cache(ABC):
@@ -19,29 +18,30 @@ class Cache(ABC):
         raise NotImplementedError
         
         
-class JsonFileCache(Cache):
-    def __init__(self, filename):
-        self.filename = filename
-        
-        try:
-            with open(filename) as f:
-                self.cache = json.load(f)
-        except ValueError:
-            self.cache = {}
-        except FileNotFoundError:
-            with open(filename, 'w+') as f:
-                f.write('{}')
-            self.cache = {}
-            
+class DiskCache(Cache):
+    """Stores each entry separately on disk, so setting an entry doesn't rewrite the whole cache.
+    Recently used entries are also kept in memory to avoid unpickling them from disk on every get.
+    """
+    def __init__(self, directory, memory_size=4096):
+        self.directory = directory
+        self.cache = diskcache.Cache(directory)
+        self.memory_cache = cachetools.LRUCache(maxsize=memory_size)
+
     def get(self, key):
+        try:
+            return self.memory_cache[key]
+        except KeyError:
+            pass
+
         val = self.cache.get(key, None)
-        if val:
-            val = jsonpickle.decode(val)
+        if val is not None:
+            self.memory_cache[key] = val
         return val
-        
+
     def set(self, key, val):
-        self.cache[key] = jsonpickle.encode(val)
-    
+        self.memory_cache[key] = val
+        self.cache.set(key, val)
+
     def commit(self):
-        with open(self.filename, 'w') as f:
-            json.dump(self.cache, f)
\ No newline at end of file
+        # Every set is already written to disk.
+        pass
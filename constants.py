@@ -2,4 +2,8 @@ ZONE_ID = 32
 API_URL = 'https://www.fflogs.com/api/v2/client'
 TOKEN_URL = 'https://www.fflogs.com/oauth/token'
 TOKEN_REQUEST_PAYLOAD = {'grant_type': 'client_credentials'}
-ABILITIES_FILENAME = 'abilities.json'
\ No newline at end of file
+ABILITIES_FILENAME = 'abilities.json'
+# The maximum number of FFLogs API requests to have in flight at once
+MAX_CONCURRENT_REQUESTS = 8
+# The number of pages of reports to query from the FFLogs API per request
+REPORT_PAGES_PER_REQUEST = 4
\ No newline at end of file
@@ -1,29 +1,20 @@
 import argparse
+import asyncio
+import bisect
 import constants
-import datetime
-import functools
-import imageio
-import io
+import httpx
 import itertools
-import json
 import logging
-import matplotlib.patches as patches
-import matplotlib.pyplot as plot
-import pathlib
-import pickle
-import requests
-import shelve
-import sys
+import msgspec
+import orjson
 
 from abc import ABC, abstractmethod
-from cache import JsonFileCache
+from cache import DiskCache
 from collections import defaultdict
+from concurrent.futures import ProcessPoolExecutor
 from configparser import ConfigParser
 from dataclasses import dataclass
-from enum import Enum
-from matplotlib.animation import FFMpegFileWriter
-from matplotlib.ticker import FuncFormatter, MultipleLocator
-from operator import itemgetter
+from operator import attrgetter, itemgetter
 
 
 logger = logging.getLogger(__name__)
@@ -37,7 +28,7 @@ logging.basicConfig(
 )
 
 
-@dataclass
+@dataclass(slots=True)
 class ProgressIndicator(ABC):
     """Class for representing misc. information about the progress of a pull."""
     index: int
@@ -45,40 +36,26 @@ class ProgressIndicator(ABC):
     style: dict
 
     @abstractmethod
-    def matches(self, token, cache, report, fight):
+    def matches(self, fight, cast_ids):
         raise NotImplementedError
 
 
-@dataclass
+@dataclass(slots=True)
 class VictoryIndicator(ProgressIndicator):
-    def matches(self, token, cache, report, fight):
+    def matches(self, fight, cast_ids):
         return fight['kill']
 
 
-@dataclass
+@dataclass(slots=True)
 class AbilityProgressIndicator(ProgressIndicator):
     """Uses ability ids to indicate progress for a pull."""
     ability_ids: frozenset[int]
 
-    def matches(self, token, cache, report, fight):
-        cache_key = f'{report["code"]}-{fight["id"]}-{fight["startTime"]}-{fight["endTime"]}'
-        if not (abilities_cast_by_enemies := cache.get(cache_key)):
-            # These abilities are implicitly sorted in order of datetime by the FFLogs API
-            abilities_cast_by_enemies = get_abilities_cast_by_enemies_by_report_and_fight(
-                token, report['code'], fight['id'], fight['startTime'], fight['endTime'],
-            )
-            cache.set(cache_key, abilities_cast_by_enemies)
-
-        # Look at the abilities cast in reverse order to get the latest progress indicating ability cast
-        pull = None
-        for ability_json in reversed(abilities_cast_by_enemies):
-            if ability_json['abilityGameID'] in self.ability_ids:
-                return True
-
-        return False
+    def matches(self, fight, cast_ids):
+        return not self.ability_ids.isdisjoint(cast_ids)
 
 
-@dataclass
+@dataclass(slots=True)
 class Pull:
     """Class for representing the basic information of a pull."""
     id: int
@@ -87,19 +64,33 @@ class Pull:
     duration_in_seconds: int
 
 
-def get_new_token(client_id, client_secret):
-    token_response = requests.post(
+class CachedPull(msgspec.Struct):
+    """The cached form of a Pull, which refers to its progress indicator by index so styling changes still apply."""
+    id: int
+    report_id: str
+    progress_index: int
+    duration_in_seconds: float
+
+
+def get_report_cache_key(report):
+    return f'pulls/{report["code"]}'
+
+
+def get_fight_cache_key(report, fight):
+    return f'cast_ability_ids/{report["code"]}-{fight["id"]}-{fight["startTime"]}-{fight["endTime"]}'
+
+
+async def get_new_token(client, client_id, client_secret):
+    token_response = await client.post(
         constants.TOKEN_URL,
         data=constants.TOKEN_REQUEST_PAYLOAD,
-        verify=False,
-        allow_redirects=False,
         auth=(client_id, client_secret),
     )
-    token_response_text = json.loads(token_response.text)
+    token_response_text = orjson.loads(token_response.content)
     return token_response_text['access_token']
 
 
-def get_abilities(token):
+async def get_abilities(client):
     """
     Gets all the game ability ids and names.
     If abilities.json doesn't exist, it pulls directly from the fflogs api.
@@ -107,10 +98,9 @@ def get_abilities(token):
     """
     abilities = []
     try:
-        with open(constants.ABILITIES_FILENAME, 'r') as f:
-            abilities = json.load(f)
+        with open(constants.ABILITIES_FILENAME, 'rb') as f:
+            abilities = orjson.loads(f.read())
     except:
-        query_headers = {'Authorization': f'Bearer {token}'}
         current_page = 1
         has_more_pages = True
         abilities = []
@@ -128,8 +118,8 @@ def get_abilities(token):
                 }}
             }}"""
             try:
-                r = requests.get(constants.API_URL, headers=query_headers, json={'query': q})
-                response_json = json.loads(r.text)
+                r = await client.post(constants.API_URL, json={'query': q})
+                response_json = orjson.loads(r.content)
 
                 has_more_pages = response_json['data']['gameData']['abilities']['has_more_pages']
                 abilities.extend(response_json['data']['gameData']['abilities']['data'])
@@ -139,15 +129,14 @@ def get_abilities(token):
 
             current_page += 1
 
-        with open(constants.ABILITIES_FILENAME, 'w') as f:
-            json.dump(abilities, f, separators=(',', ':'))
+        with open(constants.ABILITIES_FILENAME, 'wb') as f:
+            f.write(orjson.dumps(abilities))
 
     return {d['id']: d['name'] for d in abilities}
 
 
-def get_reports(token, user_id, zone_id):
+async def get_reports(client, user_id, zone_id):
     logger.info(f'Getting reports from FFLogs for user {user_id} and zone {zone_id}.')
-    query_headers = {'Authorization': f'Bearer {token}'}
 
     current_page = 1
     has_more_pages = True
@@ -155,9 +144,10 @@ def get_reports(token, user_id, zone_id):
     limit = 50
 
     while has_more_pages:
-        q = f"""query {{
-            reportData {{
-                reports(userID: {user_id}, zoneID: {zone_id}, limit: {limit}, page: {current_page}) {{
+        # Query several pages per request by aliasing each page's field (page1, page2, etc.)
+        pages = range(current_page, current_page + constants.REPORT_PAGES_PER_REQUEST)
+        reports_by_page_q = '\n'.join(
+            f"""page{page}: reports(userID: {user_id}, zoneID: {zone_id}, limit: {limit}, page: {page}) {{
                     data {{
                         fights {{
                             id
@@ -172,18 +162,28 @@ def get_reports(token, user_id, zone_id):
                         endTime
                     }}
                     has_more_pages
-                }}
+                }}"""
+            for page in pages
+        )
+        q = f"""query {{
+            reportData {{
+                {reports_by_page_q}
             }}
         }}"""
         try:
-            r = requests.get(constants.API_URL, headers=query_headers, json={'query': q})
-            response_json = json.loads(r.text)
+            r = await client.post(constants.API_URL, json={'query': q})
+            response_json = orjson.loads(r.content)
 
-            has_more_pages = response_json['data']['reportData']['reports']['has_more_pages']
-            reports.extend(response_json['data']['reportData']['reports']['data'])
+            for page in pages:
+                reports_json = response_json['data']['reportData'][f'page{page}']
+                reports.extend(reports_json['data'])
+                if not (has_more_pages := reports_json['has_more_pages']):
+                    break
         except Exception:
             logger.exception(f'Failed to get reports data. Response: {r.text}.')
             raise
+
+        current_page += constants.REPORT_PAGES_PER_REQUEST
     # Before moving on, sort the reports by start date
     reports.sort(key=itemgetter('startTime'))
     logger.info(f'{len(reports)} reports found.')
@@ -191,8 +191,7 @@ def get_reports(token, user_id, zone_id):
     return reports
 
 
-def get_abilities_cast_by_enemies_by_report_and_fight(token, report_id, fight_id, start_time, end_time):
-    query_headers = {'Authorization': f'Bearer {token}'}
+async def get_ability_ids_cast_by_enemies_by_report_and_fight(client, report_id, fight_id, start_time, end_time):
     logger.info(f'Querying FFLogs for abilities for report {report_id} and fight {fight_id}.')
 
     results = []
@@ -213,19 +212,22 @@ def get_abilities_cast_by_enemies_by_report_and_fight(token, report_id, fight_id
             }}
         }}"""
         try:
-            r = requests.get(constants.API_URL, headers=query_headers, json={'query': q})
-            response_json = json.loads(r.text)
+            r = await client.post(constants.API_URL, json={'query': q})
+            response_json = orjson.loads(r.content)
 
             start_time = response_json['data']['reportData']['report']['events']['nextPageTimestamp']
-            results.extend(d for d in response_json['data']['reportData']['report']['events']['data'] if d['type'] == 'cast')
+            # Only the ids of the abilities cast are needed, so don't hold onto (or cache) the rest of each event.
+            results.extend(
+                d['abilityGameID'] for d in response_json['data']['reportData']['report']['events']['data']
+                if d['type'] == 'cast'
+            )
         except Exception:
             logger.exception(f'Failed to get ability cast data. Response: {r.text}.')
             raise
     return results
 
 
-def get_zone_name(token, zone_id):
-    query_headers = {'Authorization': f'Bearer {token}'}
+async def get_zone_name(client, zone_id):
     logger.info(f'Querying FFLogs for zone name.')
 
     q = f"""query {{
@@ -236,8 +238,8 @@ def get_zone_name(token, zone_id):
         }}
     }}"""
     try:
-        r = requests.get(constants.API_URL, headers=query_headers, json={'query': q})
-        response_json = json.loads(r.text)
+        r = await client.post(constants.API_URL, json={'query': q})
+        response_json = orjson.loads(r.content)
 
         return response_json['data']['worldData']['zone']['name']
     except Exception:
@@ -245,25 +247,89 @@ def get_zone_name(token, zone_id):
         raise
 
 
-def parse_pulls_from_reports(token, cache, reports, progress_indicators):
+# The in-flight FFLogs queries for the ids of the abilities cast in a fight, by the fight's cache key.
+pending_ability_queries = {}
+
+
+async def get_cached_ability_ids_cast_by_enemies(client, cache, report, fight):
+    """
+    Gets the ids of the abilities cast by enemies in a fight, only querying FFLogs if they aren't already cached.
+    Concurrent calls for the same fight share the one query.
+    """
+    cache_key = get_fight_cache_key(report, fight)
+    if (ability_ids_cast_by_enemies := cache.get(cache_key)) is not None:
+        return ability_ids_cast_by_enemies
+
+    if query := pending_ability_queries.get(cache_key):
+        return await query
+
+    query = pending_ability_queries[cache_key] = asyncio.create_task(
+        get_ability_ids_cast_by_enemies_by_report_and_fight(
+            client, report['code'], fight['id'], fight['startTime'], fight['endTime'],
+        )
+    )
+    try:
+        ability_ids_cast_by_enemies = await query
+    finally:
+        del pending_ability_queries[cache_key]
+
+    cache.set(cache_key, ability_ids_cast_by_enemies)
+    return ability_ids_cast_by_enemies
+
+
+async def get_ability_ids_cast_by_enemies_by_fight(client, cache, fights_by_cache_key):
+    """Concurrently gets the ids of the abilities cast by enemies for each of the given fights."""
+    semaphore = asyncio.Semaphore(constants.MAX_CONCURRENT_REQUESTS)
+
+    async def get(report, fight):
+        async with semaphore:
+            return await get_cached_ability_ids_cast_by_enemies(client, cache, report, fight)
+
+    ability_ids_cast_by_enemies = await asyncio.gather(*[
+        get(report, fight) for report, fight in fights_by_cache_key.values()
+    ])
+    return dict(zip(fights_by_cache_key, ability_ids_cast_by_enemies))
+
+
+async def parse_pulls_from_reports(client, cache, reports, progress_indicators):
     logger.info('Parsing pulls from report data.')
 
     progress_indicators_by_index = {pi.index:pi for pi in progress_indicators}
 
+    # Get the ids of the abilities cast in every fight of the uncached reports up front,
+    # so that the ones we don't have cached can all be queried from FFLogs at once.
+    fights_by_cache_key = {}
+    for report in reports:
+        if cache.get(get_report_cache_key(report)):
+            continue
+
+        for fight in report['fights']:
+            if fight['encounterID'] == 0:
+                continue
+
+            fights_by_cache_key[get_fight_cache_key(report, fight)] = (report, fight)
+
+    ability_ids_cast_by_enemies_by_cache_key = await get_ability_ids_cast_by_enemies_by_fight(
+        client, cache, fights_by_cache_key,
+    )
+
+    # Check for the furthest progress first
+    sorted_progress_indicators = sorted(progress_indicators, key=attrgetter('index'), reverse=True)
+
     all_pulls = []
     for report in reports:
         report_id = report['code']
 
         # If the report data is cached, just use that data and move onto the next.
-        cache_key = f'report_data/{report_id}'
-        cached_report_data = cache.get(cache_key)
-        if cached_report_data:
-            logger.info(f'Using cached data of {len(cached_report_data)} pulls for report {report_id}.')
-
-            # Rehydrate progress indicator cache incase of styling changes
-            for fight in cached_report_data:
-                fight.progress = progress_indicators_by_index[fight.progress.index]
-            all_pulls.extend(cached_report_data)
+        cache_key = get_report_cache_key(report)
+        if cached_report_data := cache.get(cache_key):
+            cached_pulls = msgspec.json.decode(cached_report_data, type=list[CachedPull])
+            logger.info(f'Using cached data of {len(cached_pulls)} pulls for report {report_id}.')
+
+            all_pulls.extend(
+                Pull(pull.id, pull.report_id, progress_indicators_by_index[pull.progress_index], pull.duration_in_seconds)
+                for pull in cached_pulls
+            )
             continue
 
         # Otherwise, load up data (and then cache it).
@@ -275,9 +341,11 @@ def parse_pulls_from_reports(token, cache, reports, progress_indicators):
 
             fight_id = fight['id']
             duration_in_seconds = (fight['endTime'] - fight['startTime']) / 1000  # times are stored in milliseconds
+            cast_ids = frozenset(ability_ids_cast_by_enemies_by_cache_key[get_fight_cache_key(report, fight)])
+
             pull = None
-            for progress_indicator in sorted(progress_indicators, key=lambda pi: pi.index, reverse=True):
-                if progress_indicator.matches(token, cache, report, fight):
+            for progress_indicator in sorted_progress_indicators:
+                if progress_indicator.matches(fight, cast_ids):
                     pull = Pull(fight_id, report_id, progress_indicator, duration_in_seconds)
                     break
 
@@ -290,10 +358,14 @@ def parse_pulls_from_reports(token, cache, reports, progress_indicators):
             pulls.append(pull)
 
         logger.info(f'No cached data for report {report_id}; writing {len(pulls)} pulls to cache.')
-        cache.set(cache_key, pulls)
-        cache.commit()
+        cache.set(cache_key, msgspec.json.encode([
+            CachedPull(pull.id, pull.report_id, pull.progress.index, pull.duration_in_seconds)
+            for pull in pulls
+        ]))
         all_pulls.extend(pulls)
 
+    cache.commit()
+
     return all_pulls
 
 
@@ -306,6 +378,13 @@ def time_formatter(x, pos):
 
 
 def setup_plot():
+    # matplotlib is slow to import, so only import it once we're actually plotting.
+    # The plot only ever gets saved to a file, so use Agg rather than probing for a GUI backend.
+    import matplotlib
+    matplotlib.use('Agg')
+    import matplotlib.pyplot as plot
+    from matplotlib.ticker import FuncFormatter, MultipleLocator
+
     plot.rcParams['font.family'] = 'Liberation Serif'
     # plot.rcParams['font.size'] = '16'
 
@@ -331,30 +410,104 @@ def setup_plot():
     return figure, axes, text_axes
 
 
+class PullChart:
+    """The figure of the pull chart, along with the artists that get updated to draw each frame of it."""
+    def __init__(self, title, line_styles_by_progress_index, points_by_progress_index, report_spans):
+        import matplotlib.patches as patches
+
+        self.title = title
+        self.points_by_progress_index = points_by_progress_index
+        self.report_spans = report_spans
+        self.figure, self.axes, text_axes = setup_plot()
+
+        # Create a text object that we'll keep updated throughout the plotting.
+        self.text = text_axes.text(
+            0,
+            1,
+            '',
+            clip_on=False,
+            size='large',
+            linespacing=1.5,
+            horizontalalignment='left',
+            verticalalignment='top',
+            multialignment='left',
+        )
+
+        # Each kind of progress gets a single line of markers, which gets extended as the pulls are drawn.
+        self.lines_by_progress_index = {
+            progress_index: self.axes.plot([], [], linestyle='none', **line_style)[0]
+            for progress_index, line_style in line_styles_by_progress_index.items()
+        }
+        self.shading = [
+            self.axes.add_patch(patches.Rectangle(
+                (max(first_pull_count - 1, 1), 0), 0, 1,
+                transform=self.axes.get_xaxis_transform(), color=shade_color, alpha=0.05, lw=0, visible=False,
+            ))
+            for first_pull_count, _, shade_color in report_spans
+        ]
+        self.legend = None
+        self.legend_colors = None
+
+    def draw(self, frame):
+        """Updates the chart to show every pull up to (and including) the frame's pull."""
+        import matplotlib.patches as patches
+
+        pull_count = frame['pull_count']
+
+        for progress_index, line in self.lines_by_progress_index.items():
+            xs, ys = self.points_by_progress_index.get(progress_index, ([], []))
+            visible_count = bisect.bisect_right(xs, pull_count)
+            line.set_data(xs[:visible_count], ys[:visible_count])
+
+        for span, (first_pull_count, last_pull_count, _) in zip(self.shading, self.report_spans):
+            span.set_visible(first_pull_count <= pull_count)
+            span.set_width(min(last_pull_count, pull_count) - span.get_x())
+
+        # Lines don't rescale the axes when their data changes, so do it ourselves.
+        self.axes.relim(visible_only=True)
+        self.axes.autoscale_view()
+
+        self.axes.set_title(f'{self.title}: Pull #{pull_count}')
+        self.text.set_text(frame['info_text'])
+
+        # The legend only needs to be rebuilt when new progress shows up in it; otherwise just update the counts.
+        legend_colors = [color for _, color in frame['legend']]
+        if legend_colors != self.legend_colors:
+            self.legend = self.axes.legend(
+                handles=[patches.Patch(label=label, color=color) for label, color in frame['legend']],
+                loc='upper left',
+            )
+            self.legend_colors = legend_colors
+        else:
+            for legend_text, (label, _) in zip(self.legend.get_texts(), frame['legend']):
+                legend_text.set_text(label)
+
+    def render(self, frame):
+        """Draws the frame and returns its RGBA pixels."""
+        import numpy
+
+        self.draw(frame)
+
+        # Copy the canvas' pixels straight out of its buffer, which gets reused for the next frame.
+        self.figure.canvas.draw()
+        return numpy.array(self.figure.canvas.buffer_rgba())
+
+
+# The chart that each frame rendering process draws with, so that it only gets set up once per process.
+worker_pull_chart = None
+
+
+def init_frame_renderer(*pull_chart_args):
+    global worker_pull_chart
+    worker_pull_chart = PullChart(*pull_chart_args)
+
+
+def render_frame(frame):
+    return worker_pull_chart.render(frame)
+
+
 def plot_pull_data(title, pulls, progress_indicators, generate_gif=False):
     logger.info(f'Plotting data of {len(pulls)} pulls.')
-    figure, axes, text_axes = setup_plot()
-
-    # Create a text object that we'll keep updated throughout the plotting.
-    text = text_axes.text(
-        0,
-        1,
-        '',
-        clip_on=False,
-        size='large',
-        linespacing=1.5,
-        horizontalalignment='left',
-        verticalalignment='top',
-        multialignment='left',
-    )
-
-    if generate_gif:
-        # We want a GIF at a specific FPS, but with the final frame being held for a few seconds.
-        fps = 60
-        last_frame_duration = 6.0
-        frame_durations = [1.0 / fps] * len(pulls)
-        frame_durations[-1] = last_frame_duration
-        writer = imageio.get_writer('output/output.mp4', fps=60, quality=10)
 
     latest_kill_pull = 0
     longest_pull_time = 0.0
@@ -366,68 +519,86 @@ def plot_pull_data(title, pulls, progress_indicators, generate_gif=False):
     current_shade_color = next(shading_colors)
     total_time = 0
     unique_reports = set()
+    default_style = {'marker': 'D', 'markersize': 4, 'alpha': 0.8}
+    victory_indices = {pi.index for pi in progress_indicators if isinstance(pi, VictoryIndicator)}
+
+    # The pulls (and report shading) to plot, along with the title/text/legend to show after each pull.
+    points_by_progress_index = {pi.index: ([], []) for pi in progress_indicators}
+    report_spans = []
+    frames = []
 
     for pull_count, pull in enumerate(pulls, start=1):
         # Minor housekeeping to maintain "current report" shading and longest pull time
         if not current_report_id:
             current_report_id = pull.report_id
+            report_spans.append([pull_count, pull_count, current_shade_color])
         elif pull.report_id != current_report_id:
             current_report_id = pull.report_id
             current_shade_color = next(shading_colors)
+            report_spans.append([pull_count, pull_count, current_shade_color])
+        else:
+            report_spans[-1][1] = pull_count
 
-        if isinstance(pull.progress, VictoryIndicator):
+        progress_index = pull.progress.index
+        if progress_index in victory_indices:
             latest_kill_pull = pull_count
             best_kill_time = min(best_kill_time, pull.duration_in_seconds)
 
         longest_pull_time = max(longest_pull_time, pull.duration_in_seconds)
-        latest_progress_index_seen = max(pull.progress.index, latest_progress_index_seen)
-        progress_occurrences[pull.progress.index] = progress_occurrences[pull.progress.index] + 1
+        latest_progress_index_seen = max(progress_index, latest_progress_index_seen)
+        progress_occurrences[progress_index] = progress_occurrences[progress_index] + 1
         total_time += pull.duration_in_seconds
         unique_reports.add(pull.report_id)
 
-        axes.set_title(f'{title}: Pull #{pull_count}')
-        default_style = {'marker': 'D', 'markersize': 4, 'alpha': 0.8}
-        axes_style = default_style | pull.progress.style
-        axes.plot(pull_count, pull.duration_in_seconds, **axes_style)
-        axes.axvspan(max(pull_count - 1, 1), pull_count, color=current_shade_color, alpha=0.05, lw=0)
+        xs, ys = points_by_progress_index[progress_index]
+        xs.append(pull_count)
+        ys.append(pull.duration_in_seconds)
+
+        # Only the final frame is needed for the PNG
+        if not generate_gif and pull_count != len(pulls):
+            continue
 
         # Unfortunately, we need to some disgusting basic math to get a clean HH:ss format
         hours, remainder = divmod(int(total_time), 3600)
         minutes, seconds = divmod(remainder, 60)
-        info_text = (
-            f'Fastest kill: {time_formatter(best_kill_time, 0)}s\n'
-            f'Session count: {len(unique_reports)}\n'
-            f'Total time: {hours:02d}:{minutes:02d}:{seconds:02d}\n'
-            f'Pulls since last kill: {pull_count - latest_kill_pull}\n'
-        )
-        text.set_text(info_text)
-
-        # Generate the legend based on the progress we've seen
-        label_fmt = '{} ({})'
-        axes.legend(
-            handles=[
-                patches.Patch(label=f'{pi.label} ({progress_occurrences[pi.index]})', color=pi.style['color'])
+        frames.append({
+            'pull_count': pull_count,
+            'info_text': (
+                f'Fastest kill: {time_formatter(best_kill_time, 0)}s\n'
+                f'Session count: {len(unique_reports)}\n'
+                f'Total time: {hours:02d}:{minutes:02d}:{seconds:02d}\n'
+                f'Pulls since last kill: {pull_count - latest_kill_pull}\n'
+            ),
+            # The legend is based on the progress we've seen
+            'legend': [
+                (f'{pi.label} ({progress_occurrences[pi.index]})', pi.style['color'])
                 for pi in progress_indicators
                 if pi.index <= latest_progress_index_seen
             ],
-            loc='upper left',
-        )
-
-        if generate_gif:
-            image_buffer = io.BytesIO()
-            figure.savefig(image_buffer, format='png')
-            image_buffer.seek(0)
-            writer.append_data(imageio.imread(image_buffer))
+        })
 
-        print(f'\r{100 * pull_count / len(pulls):.1f}% done processing.', end='')
+    line_styles_by_progress_index = {pi.index: default_style | pi.style for pi in progress_indicators}
+    pull_chart_args = (title, line_styles_by_progress_index, points_by_progress_index, report_spans)
 
     if generate_gif:
+        import imageio
+
+        # Drawing the frames is the slow part, so spread them across processes and write them back in order.
+        # The chart's 1000x500 frames are already even-sized, so don't let imageio rescale each one to a multiple of 16.
+        writer = imageio.get_writer('output/output.mp4', fps=60, quality=10, macro_block_size=1)
+        with ProcessPoolExecutor(initializer=init_frame_renderer, initargs=pull_chart_args) as executor:
+            for frame, image in zip(frames, executor.map(render_frame, frames, chunksize=16)):
+                writer.append_data(image)
+                print(f'\r{100 * frame["pull_count"] / len(pulls):.1f}% done processing.', end='')
         writer.close()
     else:
-        figure.savefig('output/output.png', format='png')
+        pull_chart = PullChart(*pull_chart_args)
+        if frames:
+            pull_chart.draw(frames[-1])
+        pull_chart.figure.savefig('output/output.png', format='png')
 
 
-def main():
+async def main_async():
     config_filename = 'config.ini'
     config = ConfigParser()
     config.read(config_filename)
@@ -441,7 +612,7 @@ def main():
     )
     args = parser.parse_args()
 
-    cache = JsonFileCache('cache.json')
+    cache = DiskCache('cache')
 
     # A list of progress indicating abilities.
     # Note: this is extremely dependent on having unique abilities cast per phase.
@@ -458,22 +629,29 @@ def main():
         VictoryIndicator(index=8, label='Prey Slaughtered', style={'color': 'gold', 'mec': 'black', 'marker': '*', 'markersize': 12})
     ]
 
-    if not (token := config.get('main', 'TOKEN', fallback=None)):
-        token = get_new_token(config.get('main', 'CLIENT_ID'), config.get('main', 'CLIENT_SECRET'))
-        config['main']['TOKEN'] = token
-        with open(config_filename, 'w') as f:
-            config.write(f)
+    # Every FFLogs request shares the one client, so its connection gets reused rather than reopened per request.
+    async with httpx.AsyncClient(http2=True, timeout=30) as client:
+        if not (token := config.get('main', 'TOKEN', fallback=None)):
+            token = await get_new_token(client, config.get('main', 'CLIENT_ID'), config.get('main', 'CLIENT_SECRET'))
+            config['main']['TOKEN'] = token
+            with open(config_filename, 'w') as f:
+                config.write(f)
 
-        logger.info('New token generated and config file updated.')
+            logger.info('New token generated and config file updated.')
 
-    logger.info('Token found.')
+        logger.info('Token found.')
+        client.headers['Authorization'] = f'Bearer {token}'
+
+        user_id = config.getint('main', 'FFLOGS_USER_ID')
+        # The zone name is only needed for plotting, so query it alongside the reports.
+        zone_name, reports = await asyncio.gather(
+            get_zone_name(client, constants.ZONE_ID),
+            get_reports(client, user_id, constants.ZONE_ID),
+        )
+        all_pulls = await parse_pulls_from_reports(client, cache, reports, progress_indicators)
 
-    user_id = config.getint('main', 'FFLOGS_USER_ID')
-    zone_name = get_zone_name(token, constants.ZONE_ID)
-    reports = get_reports(token, user_id, constants.ZONE_ID)
-    all_pulls = parse_pulls_from_reports(token, cache, reports, progress_indicators)
     plot_pull_data(zone_name, all_pulls, progress_indicators, args.generate_gif)
 
 
 if __name__ == '__main__':
-    main()
\ No newline at end of file
+    asyncio.run(main_async())
\ No newline at end of file